@@ -4,114 +4,125 @@ A module for calculating bowling game scores.
 """
 
 
+# Most rolls a single game can take: nine open frames plus a 10th frame
+# with a strike or spare and its bonus balls
+MAX_ROLLS = 21
+
+# Pins standing at the start of each frame
+MAX_PINS = 10
+
+# Every valid pin count for a single roll, as bytes
+_PIN_COUNTS = bytes(range(MAX_PINS + 1))
+
+
 class BowlingGame:
     def __init__(self):
         # Initialize a new game with 10 frames
         # Each frame has up to 2 rolls (except the 10th frame which can have 3 )
-        self.rolls = []
+        self._rolls = bytearray(MAX_ROLLS)
         self.current_roll = 0
 
+    @property
+    def rolls(self):
+        """Read-only view of the rolls recorded so far."""
+        return memoryview(self._rolls)[:self.current_roll].toreadonly()
+
     def roll(self, pins):
         """
         Records a roll in the game.
 
         Args:
             pins: Number of pins knocked down in this roll
-        """
-        self.rolls.append(pins)
-        self.current_roll += 1
 
-    def score(self):
-        """Calculate the score for the current game."""
-        score = 0
-        frame_index = 0
-
-        for frame in range(10):
-            if frame_index >= len(self.rolls):
-                break  # stop if no more rolls available
-
-            if self._is_strike(frame_index):
-                # Strike
-                score += 10 + self._strike_bonus(frame_index)
-                frame_index += 1
-            elif self._is_spare(frame_index):
-                # Spare
-                score += 10 + self._spare_bonus(frame_index)
-                frame_index += 2
-            else:
-                # Open frame
-                score += self._sum_of_balls_in_frame(frame_index)
-                frame_index += 2
-
-        return score
-
-    def _is_strike(self, frame_index):
-        """
-        Check if the roll at frame_index is a strike.
-
-        Args:
-            frame_index: Index of the roll to check
-
-        Returns:
-            True if the roll is a strike, False otherwise
+        Raises:
+            ValueError: If pins is not between 0 and MAX_PINS
+            IndexError: If the game already has MAX_ROLLS rolls
         """
-        return frame_index < len(self.rolls) and self.rolls[frame_index] == 10
-
-    def _is_spare(self, frame_index):
-        """
-        Check if the rolls at frame_index and frame_index + 1 form a spare.
-
-        Args:
-            frame_index: Index of the first roll in a frame
-
-        Returns:
-            True if the rolls form a spare, False otherwise
-        """
-        return (
-            frame_index + 1 < len(self.rolls)
-            and self.rolls[frame_index] + self.rolls[frame_index + 1] == 10
-        )
-
-    def _strike_bonus(self, frame_index):
-        """
-        Calculate the bonus for a strike.
-
-        Args:
-            frame_index: Index of the strike roll
-
-        Returns:
-            The value of the next two rolls after the strike
-        """
-        if frame_index + 2 < len(self.rolls):
-            return self.rolls[frame_index + 1] + self.rolls[frame_index + 2]
-        return 0
+        if not 0 <= pins <= MAX_PINS:
+            raise ValueError(f"pins must be between 0 and {MAX_PINS}, got {pins}")
+        if self.current_roll >= MAX_ROLLS:
+            raise IndexError(f"a game has at most {MAX_ROLLS} rolls")
+        self._rolls[self.current_roll] = pins
+        self.current_roll += 1
 
-    def _spare_bonus(self, frame_index):
+    def roll_many(self, pins):
         """
-        Calculate the bonus for a spare.
+        Records a sequence of rolls in the game.
 
         Args:
-            frame_index: Index of the first roll in a spare
+            pins: Iterable of pin counts, one per roll, in order
 
-        Returns:
-            The value of the roll after the spare
+        Raises:
+            TypeError: If pins is a single int rather than an iterable
+            ValueError: If any pin count is not between 0 and MAX_PINS
+            IndexError: If the rolls would exceed MAX_ROLLS for the game
         """
-        if frame_index + 2 < len(self.rolls):
-            return self.rolls[frame_index + 2]
-        return 0
+        if isinstance(pins, int):
+            raise TypeError("roll_many expects an iterable of pin counts, not an int")
+        # bytes() checks each count is an int in 0..255 at C speed; stripping
+        # the valid counts leaves anything above MAX_PINS, again without a
+        # Python-level loop
+        try:
+            buf = bytes(pins)
+        except ValueError:
+            raise ValueError(f"pins must be between 0 and {MAX_PINS}") from None
+        invalid = buf.lstrip(_PIN_COUNTS)
+        if invalid:
+            raise ValueError(f"pins must be between 0 and {MAX_PINS}, got {invalid[0]}")
+        start = self.current_roll
+        end = start + len(buf)
+        if end > MAX_ROLLS:
+            raise IndexError(f"a game has at most {MAX_ROLLS} rolls")
+        self._rolls[start:end] = buf
+        self.current_roll = end
 
-    def _sum_of_balls_in_frame(self, frame_index):
-        """
-        Calculate the sum of the two rolls in an open frame.
-
-        Args:
-            frame_index: Index of the first roll in a frame
-
-        Returns:
-            The sum of the rolls in the frame
-        """
-        if frame_index + 1 < len(self.rolls):
-            return self.rolls[frame_index] + self.rolls[frame_index + 1]
-        elif frame_index < len(self.rolls):
-            return self.rolls[frame_index]
-        return 0
+    def score(self):
+        """Calculate the score for the current game."""
+        return _score_kernel(self._rolls, self.current_roll)
+
+
+def _score_kernel(rolls, n):
+    """
+    Walk the first n rolls frame by frame and total the score.
+
+    Frames that are still waiting on their bonus rolls score no bonus,
+    and an incomplete final frame scores the pins rolled so far.
+
+    Args:
+        rolls: Sequence of pin counts, one per roll
+        n: Number of rolls recorded in rolls
+
+    Returns:
+        The total score of the first ten frames
+    """
+    score = 0
+    i = 0
+
+    for _ in range(10):
+        if i >= n:
+            break  # stop if no more rolls available
+
+        first = rolls[i]
+        if first == MAX_PINS:
+            # Strike
+            score += 10
+            if i + 2 < n:
+                score += rolls[i + 1] + rolls[i + 2]
+            i += 1
+        elif i + 1 < n:
+            frame = first + rolls[i + 1]
+            if frame == MAX_PINS:
+                # Spare
+                score += 10
+                if i + 2 < n:
+                    score += rolls[i + 2]
+            else:
+                # Open frame
+                score += frame
+            i += 2
+        else:
+            # Frame still in progress
+            score += first
+            i += 2
+
+    return score
@@ -13,12 +13,26 @@ Test Categories:
 
 The tests follow the unittest framework conventions and use the
 Arrange-Act-Assert pattern for clarity.
+
+The test classes share no state, so the suite can also be spread across
+cores with pytest-xdist (``pytest -n auto test_bowling.py``). CI runs it
+serially: the whole suite takes a few milliseconds, less than it costs to
+start the xdist workers.
 """
 
+import sys
 import unittest
 from bowling_game import BowlingGame
 
 
+# Canonical roll sequences from example_usage.py, shared by the tests below
+_EXAMPLE_ROLLS = (10, 3, 6, 5, 5, 8, 1, 10, 10, 10, 9, 0, 7, 3, 10, 10, 8)
+_REGULAR_ROLLS = (3, 4, 2, 5, 1, 6, 4, 2, 8, 1, 7, 1, 5, 3, 2, 3, 4, 3, 2, 6)
+_PERFECT_ROLLS = (10,) * 12
+_GUTTER_ROLLS = (0,) * 20
+_ALL_SPARES_ROLLS = (5,) * 21
+
+
 class TestBowlingGame(unittest.TestCase):
     """Test cases for the BowlingGame class."""
 
@@ -35,8 +49,7 @@ class TestBowlingGame(unittest.TestCase):
     def test_gutter_game(self):
         """Test a game with all gutter balls (0 pins)."""
         # Arrange & Act: Roll 20 gutter balls
-        for _ in range(20):
-            self.game.roll(0)
+        self.game.roll_many(_GUTTER_ROLLS)
         
         # Assert
         self.assertEqual(self.game.score(), 0)
@@ -44,8 +57,7 @@ class TestBowlingGame(unittest.TestCase):
     def test_all_ones(self):
         """Test a game where player knocks down 1 pin per roll."""
         # Arrange & Act: Roll 1 pin 20 times
-        for _ in range(20):
-            self.game.roll(1)
+        self.game.roll_many([1] * 20)
         
         # Assert: 20 rolls * 1 pin = 20 points
         self.assertEqual(self.game.score(), 20)
@@ -58,8 +70,7 @@ class TestBowlingGame(unittest.TestCase):
         self.game.roll(3)  # Bonus ball for spare
         
         # Roll gutter balls for remaining frames
-        for _ in range(17):
-            self.game.roll(0)
+        self.game.roll_many([0] * 17)
         
         # Assert: Spare (10) + bonus (3) + regular scoring (3) = 16
         self.assertEqual(self.game.score(), 16)
@@ -72,8 +83,7 @@ class TestBowlingGame(unittest.TestCase):
         self.game.roll(4)   # Second bonus ball
         
         # Roll gutter balls for remaining frames
-        for _ in range(16):
-            self.game.roll(0)
+        self.game.roll_many([0] * 16)
         
         # Assert: Strike (10) + bonus (3+4) + regular scoring (3+4) = 24
         self.assertEqual(self.game.score(), 24)
@@ -83,8 +93,7 @@ class TestBowlingGame(unittest.TestCase):
     def test_perfect_game(self):
         """Test a perfect game (all strikes)."""
         # Arrange & Act: Roll 12 strikes (10 frames + 2 bonus)
-        for _ in range(12):
-            self.game.roll(10)
+        self.game.roll_many(_PERFECT_ROLLS)
         
         # Assert: Perfect game = 300 points
         self.assertEqual(self.game.score(), 300)
@@ -94,8 +103,7 @@ class TestBowlingGame(unittest.TestCase):
     def test_all_spares(self):
         """Test a game with all spares."""
         # Arrange & Act: Roll 5 pins for all 21 balls
-        for _ in range(21):
-            self.game.roll(5)
+        self.game.roll_many(_ALL_SPARES_ROLLS)
         
         # Assert: All spares = 150 points
         self.assertEqual(self.game.score(), 150)
@@ -105,8 +113,7 @@ class TestBowlingGame(unittest.TestCase):
     def test_10th_frame_strike_with_bonus(self):
         """Test 10th frame with strike and two bonus balls."""
         # Arrange: Set up 9 gutter frames
-        for _ in range(18):
-            self.game.roll(0)
+        self.game.roll_many([0] * 18)
         
         # Act: 10th frame with strike + two bonus balls
         self.game.roll(10)  # Strike in 10th
@@ -119,8 +126,7 @@ class TestBowlingGame(unittest.TestCase):
     def test_10th_frame_spare_with_bonus(self):
         """Test 10th frame with spare and one bonus ball."""
         # Arrange: Set up 9 gutter frames
-        for _ in range(18):
-            self.game.roll(0)
+        self.game.roll_many([0] * 18)
         
         # Act: 10th frame with spare + one bonus ball
         self.game.roll(7)   # First ball
@@ -133,8 +139,7 @@ class TestBowlingGame(unittest.TestCase):
     def test_10th_frame_open(self):
         """Test 10th frame with open frame (no bonus balls)."""
         # Arrange: Set up 9 gutter frames
-        for _ in range(18):
-            self.game.roll(0)
+        self.game.roll_many([0] * 18)
         
         # Act: 10th frame open
         self.game.roll(4)
@@ -155,37 +160,12 @@ class TestBowlingGame(unittest.TestCase):
         self.game.roll(3)   # Frame 4, ball 2
         
         # Roll gutter balls for remaining frames
-        for _ in range(12):
-            self.game.roll(0)
+        self.game.roll_many([0] * 12)
         
         # Assert: Frame 1: 10+10+10=30, Frame 2: 10+10+5=25, Frame 3: 10+5+3=18, Frame 4: 5+3=8
         # Total: 30 + 25 + 18 + 8 = 81
         self.assertEqual(self.game.score(), 81)
 
-    # ===== Example Scenarios from example_usage.py =====
-
-    def test_example_game_scenario(self):
-        """Test the specific example game from example_usage.py."""
-        # Arrange & Act: Replicate exact rolls from example_game()
-        rolls = [10, 3, 6, 5, 5, 8, 1, 10, 10, 10, 9, 0, 7, 3, 10, 10, 8]
-        
-        for pins in rolls:
-            self.game.roll(pins)
-        
-        # Assert: Expected score from example_usage.py
-        self.assertEqual(self.game.score(), 190)
-
-    def test_regular_game_scenario(self):
-        """Test the regular game scenario from example_usage.py."""
-        # Arrange & Act: Replicate exact rolls from regular_game()
-        rolls = [3, 4, 2, 5, 1, 6, 4, 2, 8, 1, 7, 1, 5, 3, 2, 3, 4, 3, 2, 6]
-        
-        for pins in rolls:
-            self.game.roll(pins)
-        
-        # Assert: Expected score from example_usage.py
-        self.assertEqual(self.game.score(), 72)
-
     # ===== Strike Bonus Calculation Tests =====
 
     def test_strike_bonus_calculation(self):
@@ -196,8 +176,7 @@ class TestBowlingGame(unittest.TestCase):
         self.game.roll(3)   # Second next roll
         
         # Roll gutter balls for remaining frames
-        for _ in range(16):
-            self.game.roll(0)
+        self.game.roll_many([0] * 16)
         
         # Assert: Strike (10) + bonus (4+3) + regular frame (4+3) = 24
         self.assertEqual(self.game.score(), 24)
@@ -213,13 +192,12 @@ class TestBowlingGame(unittest.TestCase):
         self.game.roll(2)   # Complete next frame
         
         # Roll gutter balls for remaining frames
-        for _ in range(14):
-            self.game.roll(0)
+        self.game.roll_many([0] * 14)
         
         # Assert: Spare (10) + bonus (7) + regular frame (7+2) = 26
         self.assertEqual(self.game.score(), 26)
 
-    # ===== Helper Method Tests =====
+    # ===== Strike and Spare Detection Tests =====
 
     def test_is_strike_detection(self):
         """Test strike detection through scoring behavior."""
@@ -229,8 +207,7 @@ class TestBowlingGame(unittest.TestCase):
         self.game.roll(3)
         
         # Roll gutter balls for remaining frames
-        for _ in range(16):
-            self.game.roll(0)
+        self.game.roll_many([0] * 16)
         
         # Assert: If strike detected correctly, score should be 10+3+3+3+3=22
         # If not detected as strike, would be 10+3+3=16
@@ -245,35 +222,18 @@ class TestBowlingGame(unittest.TestCase):
         self.game.roll(2)
         
         # Roll gutter balls for remaining frames
-        for _ in range(14):
-            self.game.roll(0)
+        self.game.roll_many([0] * 14)
         
         # Assert: If spare detected correctly, score should be 10+4+4+2=20
         # If not detected as spare, would be 7+3+4+2=16
         self.assertEqual(self.game.score(), 20)
 
-    # ===== Boundary Value Tests =====
-
-    def test_maximum_pins_per_roll(self):
-        """Test with maximum pins (10) in various scenarios."""
-        # Test that rolling 10 pins is handled correctly in different contexts
-        # This is tested implicitly through strike tests above
-        pass
-
-    def test_minimum_pins_per_roll(self):
-        """Test with minimum pins (0) in various scenarios."""
-        # Test that rolling 0 pins is handled correctly
-        # This is tested through gutter_game test above
-        pass
-
     # ===== Frame Progression Tests =====
 
     def test_normal_frame_progression(self):
         """Test that frames progress correctly in normal gameplay."""
         # Arrange & Act: Play a simple game with known pattern
-        for frame in range(9):  # First 9 frames
-            self.game.roll(4)
-            self.game.roll(3)
+        self.game.roll_many([4, 3] * 9)  # First 9 frames
         
         # 10th frame
         self.game.roll(4)
@@ -322,8 +282,7 @@ class TestBowlingGameEdgeCases(unittest.TestCase):
     def test_late_game_strikes(self):
         """Test strikes in later frames."""
         # Arrange: Set up 7 open frames
-        for _ in range(14):
-            self.game.roll(3)
+        self.game.roll_many([3] * 14)
         
         # Act: Strikes in frames 8, 9, 10
         self.game.roll(10)  # Frame 8 strike
@@ -350,10 +309,51 @@ class TestBowlingGameInputValidation(unittest.TestCase):
             game = BowlingGame()
             game.roll(pins)
             # Should not raise any exception
-            self.assertIsInstance(game.rolls, list)
+            self.assertIsInstance(game.rolls, memoryview)
+            self.assertTrue(game.rolls.readonly)
             self.assertEqual(len(game.rolls), 1)
             self.assertEqual(game.rolls[0], pins)
 
+    def test_roll_many_matches_individual_rolls(self):
+        """Test that roll_many records the same rolls as repeated roll calls."""
+        rolls = [10, 7, 3, 9, 0, 10, 0, 8, 8, 2, 0, 6, 10, 10, 10, 8, 1]
+        single_game = BowlingGame()
+        for pins in rolls:
+            single_game.roll(pins)
+
+        self.game.roll_many(rolls)
+
+        self.assertEqual(list(self.game.rolls), list(single_game.rolls))
+        self.assertEqual(self.game.current_roll, single_game.current_roll)
+        self.assertEqual(self.game.score(), single_game.score())
+
+    def test_invalid_pin_counts_rejected(self):
+        """Test that pin counts outside 0-10 are rejected without being recorded."""
+        for pins in (-1, 11, 255, 256):
+            with self.subTest(pins=pins):
+                with self.assertRaisesRegex(ValueError, "pins must be between 0 and 10"):
+                    self.game.roll(pins)
+                with self.assertRaisesRegex(ValueError, "pins must be between 0 and 10"):
+                    self.game.roll_many([3, pins])
+                self.assertEqual(self.game.current_roll, 0)
+
+    def test_roll_many_rejects_int(self):
+        """Test that roll_many refuses a bare int instead of treating it as a count."""
+        with self.assertRaises(TypeError):
+            self.game.roll_many(5)
+
+        self.assertEqual(self.game.current_roll, 0)
+        self.assertEqual(len(self.game.rolls), 0)
+
+    def test_rolls_beyond_game_length_rejected(self):
+        """Test that a game refuses more rolls than it can hold."""
+        self.game.roll_many(_ALL_SPARES_ROLLS)
+
+        with self.assertRaises(IndexError):
+            self.game.roll(5)
+        with self.assertRaises(IndexError):
+            BowlingGame().roll_many([0] * 22)
+
     def test_frame_scoring_combinations(self):
         """Test various frame scoring combinations."""
         test_cases = [
@@ -366,16 +366,14 @@ class TestBowlingGameInputValidation(unittest.TestCase):
         for rolls, expected_base in test_cases:
             with self.subTest(rolls=rolls):
                 game = BowlingGame()
-                for pins in rolls:
-                    game.roll(pins)
+                game.roll_many(rolls)
                 
                 # For testing purposes, complete the game with gutter balls
                 remaining_rolls = 20 - len(rolls)
                 if rolls == [10]:  # Strike case
                     remaining_rolls = 18  # Strike uses only 1 roll
                 
-                for _ in range(remaining_rolls):
-                    game.roll(0)
+                game.roll_many([0] * remaining_rolls)
                 
                 # Basic validation that score is calculated
                 score = game.score()
@@ -386,87 +384,33 @@ class TestBowlingGameInputValidation(unittest.TestCase):
 class TestBowlingGameExampleScenarios(unittest.TestCase):
     """Test the specific scenarios from example_usage.py."""
 
-    def test_example_game_from_usage(self):
-        """Test the exact example game scenario."""
-        game = BowlingGame()
-        
-        # Exact rolls from example_usage.py example_game()
-        rolls = [10, 3, 6, 5, 5, 8, 1, 10, 10, 10, 9, 0, 7, 3, 10, 10, 8]
-        
-        for pins in rolls:
-            game.roll(pins)
-        
-        actual_score = game.score()
-        expected_score = 190
-        
-        self.assertEqual(actual_score, expected_score, 
-                        f"Example game failed: expected {expected_score}, got {actual_score}")
-
-    def test_perfect_game_from_usage(self):
-        """Test the perfect game scenario."""
-        game = BowlingGame()
-        
-        # 12 strikes as in example_usage.py
-        for _ in range(12):
-            game.roll(10)
-        
-        actual_score = game.score()
-        expected_score = 300
-        
-        self.assertEqual(actual_score, expected_score,
-                        f"Perfect game failed: expected {expected_score}, got {actual_score}")
-
-    def test_all_spares_from_usage(self):
-        """Test the all spares scenario."""
-        game = BowlingGame()
-        
-        # 21 rolls of 5 pins each
-        for _ in range(21):
-            game.roll(5)
-        
-        actual_score = game.score()
-        expected_score = 150
-        
-        self.assertEqual(actual_score, expected_score,
-                        f"All spares game failed: expected {expected_score}, got {actual_score}")
-
-    def test_gutter_game_from_usage(self):
-        """Test the gutter game scenario."""
-        game = BowlingGame()
-        
-        # 20 gutter balls
-        for _ in range(20):
-            game.roll(0)
-        
-        actual_score = game.score()
-        expected_score = 0
-        
-        self.assertEqual(actual_score, expected_score,
-                        f"Gutter game failed: expected {expected_score}, got {actual_score}")
-
-    def test_regular_game_from_usage(self):
-        """Test the regular game scenario."""
-        game = BowlingGame()
-        
-        # Exact rolls from example_usage.py regular_game()
-        rolls = [3, 4, 2, 5, 1, 6, 4, 2, 8, 1, 7, 1, 5, 3, 2, 3, 4, 3, 2, 6]
-        
-        for pins in rolls:
-            game.roll(pins)
-        
-        actual_score = game.score()
-        expected_score = 72
-        
-        self.assertEqual(actual_score, expected_score,
-                        f"Regular game failed: expected {expected_score}, got {actual_score}")
+    # (name, rolls, expected score) for the mixed games in example_usage.py;
+    # its perfect, gutter and all-spares games are covered in TestBowlingGame
+    SCENARIOS = (
+        ("example", _EXAMPLE_ROLLS, 190),
+        ("regular", _REGULAR_ROLLS, 72),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Play each scenario game once and share the scores across tests."""
+        cls.scores = {}
+        for name, rolls, _ in cls.SCENARIOS:
+            game = BowlingGame()
+            game.roll_many(rolls)
+            cls.scores[name] = game.score()
 
+    def test_scenarios(self):
+        """Test each mixed game scenario from example_usage.py."""
+        for name, _, expected_score in self.SCENARIOS:
+            with self.subTest(name=name):
+                actual_score = self.__class__.scores[name]
+                self.assertEqual(actual_score, expected_score,
+                                f"{name} game failed: expected {expected_score}, got {actual_score}")
 
-class TestBowlingGameHelperMethods(unittest.TestCase):
-    """Test the behavior of helper methods through public interface."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.game = BowlingGame()
+class TestBowlingGameStrikeSpareScoring(unittest.TestCase):
+    """Test that strikes and spares score their bonuses through the public interface."""
 
     def test_strike_detection_behavior(self):
         """Test strike detection through scoring differences."""
@@ -486,9 +430,8 @@ class TestBowlingGameHelperMethods(unittest.TestCase):
         non_strike_game.roll(4)
         
         # Complete both games with gutter balls
-        for _ in range(16):
-            strike_game.roll(0)
-            non_strike_game.roll(0)
+        strike_game.roll_many([0] * 16)
+        non_strike_game.roll_many([0] * 16)
         
         # Assert: Strike game should score higher due to bonus
         strike_score = strike_game.score()
@@ -514,9 +457,8 @@ class TestBowlingGameHelperMethods(unittest.TestCase):
         non_spare_game.roll(2)
         
         # Complete both games with gutter balls
-        for _ in range(14):
-            spare_game.roll(0)
-            non_spare_game.roll(0)
+        spare_game.roll_many([0] * 14)
+        non_spare_game.roll_many([0] * 14)
         
         # Assert: Spare game should score higher due to bonus
         spare_score = spare_game.score()
@@ -526,18 +468,11 @@ class TestBowlingGameHelperMethods(unittest.TestCase):
 
 def run_all_tests():
     """Run all test suites and return results."""
-    # Create test suite
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestBowlingGame))
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestBowlingGameEdgeCases))
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestBowlingGameInputValidation))
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestBowlingGameExampleScenarios))
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestBowlingGameHelperMethods))
+    # Collect every test class defined in this module
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    runner = unittest.TextTestRunner(verbosity=1, buffer=True)
     result = runner.run(suite)
     
     return result
@@ -545,4 +480,4 @@ def run_all_tests():
 
 if __name__ == '__main__':
     # Run tests using unittest's main method
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=1, buffer=True)
\ No newline at end of file